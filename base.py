@@ -295,7 +295,7 @@ class Location(simpy.Resource):
         self.max_day_contamination = 0
 
     def infectious_human(self):
-        return any([h.is_infectious for h in self.humans])
+        return any(h.is_infectious for h in self.humans)
 
     def __repr__(self):
         return f"{self.name} - occ:{len(self.humans)}/{self.capacity} - I:{self.is_contaminated}"